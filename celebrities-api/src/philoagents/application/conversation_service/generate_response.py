@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, AsyncGenerator, Union
 
-from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
 from opik.integrations.langchain import OpikTracer
 
@@ -56,7 +56,7 @@ async def get_response(
                 celeb_id if not new_thread else f"{celeb_id}-{uuid.uuid4()}"
             )
             config = {
-                "configurable": {"thread_id": thread_id},
+                "configurable": {"thread_id": thread_id, "celeb_id": celeb_id},
                 "callbacks": [opik_tracer],
             }
             output_state = await graph.ainvoke(
@@ -117,7 +117,7 @@ async def get_streaming_response(
                 celeb_id if not new_thread else f"{celeb_id}-{uuid.uuid4()}"
             )
             config = {
-                "configurable": {"thread_id": thread_id},
+                "configurable": {"thread_id": thread_id, "celeb_id": celeb_id},
                 "callbacks": [opik_tracer],
             }
 
@@ -132,8 +132,10 @@ async def get_streaming_response(
                 config=config,
                 stream_mode="messages",
             ):
+                # Streamed tokens arrive as AIMessageChunks, while responses served
+                # from the cache arrive as a single AIMessage.
                 if chunk[1]["langgraph_node"] == "conversation_node" and isinstance(
-                    chunk[0], AIMessageChunk
+                    chunk[0], AIMessage
                 ):
                     yield chunk[0].content
 
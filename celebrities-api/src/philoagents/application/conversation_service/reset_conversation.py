@@ -1,15 +1,28 @@
+import asyncio
+
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient
 
 from philoagents.config import settings
 
+# Fixed for the lifetime of the process, so computed once at import.
+_STATE_COLLECTIONS = (
+    settings.MONGO_STATE_CHECKPOINT_COLLECTION,
+    settings.MONGO_STATE_WRITES_COLLECTION,
+)
+_STATE_COLLECTIONS_FILTER = {"name": {"$in": list(_STATE_COLLECTIONS)}}
+
 
-async def reset_conversation_state() -> dict:
+async def reset_conversation_state(client: AsyncMongoClient) -> dict:
     """Deletes all conversation state data from MongoDB.
 
     This function removes all stored conversation checkpoints and writes,
     effectively resetting all celeb conversations.
 
+    Args:
+        client: Shared async MongoDB client whose connection pool is reused
+            across requests.
+
     Returns:
         dict: Status message indicating success or failure with details
               about which collections were deleted
@@ -18,24 +31,23 @@ async def reset_conversation_state() -> dict:
         Exception: If there's an error connecting to MongoDB or deleting collections
     """
     try:
-        client = MongoClient(settings.MONGO_URI)
         db = client[settings.MONGO_DB_NAME]
 
-        collections_deleted = []
-
-        if settings.MONGO_STATE_CHECKPOINT_COLLECTION in db.list_collection_names():
-            db.drop_collection(settings.MONGO_STATE_CHECKPOINT_COLLECTION)
-            collections_deleted.append(settings.MONGO_STATE_CHECKPOINT_COLLECTION)
-            logger.info(
-                f"Deleted collection: {settings.MONGO_STATE_CHECKPOINT_COLLECTION}"
-            )
-
-        if settings.MONGO_STATE_WRITES_COLLECTION in db.list_collection_names():
-            db.drop_collection(settings.MONGO_STATE_WRITES_COLLECTION)
-            collections_deleted.append(settings.MONGO_STATE_WRITES_COLLECTION)
-            logger.info(f"Deleted collection: {settings.MONGO_STATE_WRITES_COLLECTION}")
+        # Check which state collections exist with a single round trip.
+        existing_collections = set(
+            await db.list_collection_names(filter=_STATE_COLLECTIONS_FILTER)
+        )
+        collections_deleted = [
+            name for name in _STATE_COLLECTIONS if name in existing_collections
+        ]
 
-        client.close()
+        # Dropping is a metadata operation, independent of the number of stored
+        # checkpoints. The collections are independent, so drop them concurrently.
+        await asyncio.gather(
+            *(db.drop_collection(name) for name in collections_deleted)
+        )
+        for name in collections_deleted:
+            logger.info(f"Deleted collection: {name}")
 
         if collections_deleted:
             return {
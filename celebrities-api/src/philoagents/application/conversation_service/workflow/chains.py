@@ -1,7 +1,9 @@
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_groq import ChatGroq
 
-from philoagents.application.conversation_service.workflow.tools import tools
+from philoagents.application.conversation_service.workflow.tools import get_tools
 from philoagents.config import settings
 from philoagents.domain.prompts import (
     CONTEXT_SUMMARY_PROMPT,
@@ -19,12 +21,23 @@ def get_chat_model(temperature: float = 0.7, model_name: str = settings.GROQ_LLM
     )
 
 
+# Only the prompt templates are cached. ChatGroq pools its HTTP connections in an
+# async client bound to the event loop it first runs on, so the models are built
+# per call and never shared across event loops.
+
+
 def get_celeb_response_chain():
     model = get_chat_model()
-    model = model.bind_tools(tools)
+    model = model.bind_tools(get_tools())
+
+    return _get_celeb_response_prompt() | model
+
+
+@lru_cache(maxsize=1)
+def _get_celeb_response_prompt() -> ChatPromptTemplate:
     system_message = CELEB_CHARACTER_CARD
 
-    prompt = ChatPromptTemplate.from_messages(
+    return ChatPromptTemplate.from_messages(
         [
             ("system", system_message.prompt),
             MessagesPlaceholder(variable_name="messages"),
@@ -32,15 +45,20 @@ def get_celeb_response_chain():
         template_format="jinja2",
     )
 
-    return prompt | model
-
 
 def get_conversation_summary_chain(summary: str = ""):
     model = get_chat_model(model_name=settings.GROQ_LLM_MODEL_SUMMARY)
 
-    summary_message = EXTEND_SUMMARY_PROMPT if summary else SUMMARY_PROMPT
+    # The prompt only depends on whether there is a summary to extend, so the two
+    # variants are built once and shared across turns.
+    return _get_conversation_summary_prompt(extend=bool(summary)) | model
 
-    prompt = ChatPromptTemplate.from_messages(
+
+@lru_cache(maxsize=2)
+def _get_conversation_summary_prompt(extend: bool) -> ChatPromptTemplate:
+    summary_message = EXTEND_SUMMARY_PROMPT if extend else SUMMARY_PROMPT
+
+    return ChatPromptTemplate.from_messages(
         [
             MessagesPlaceholder(variable_name="messages"),
             ("human", summary_message.prompt),
@@ -48,16 +66,18 @@ def get_conversation_summary_chain(summary: str = ""):
         template_format="jinja2",
     )
 
-    return prompt | model
-
 
 def get_context_summary_chain():
     model = get_chat_model(model_name=settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
-    prompt = ChatPromptTemplate.from_messages(
+
+    return _get_context_summary_prompt() | model
+
+
+@lru_cache(maxsize=1)
+def _get_context_summary_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages(
         [
             ("human", CONTEXT_SUMMARY_PROMPT.prompt),
         ],
         template_format="jinja2",
     )
-
-    return prompt | model
\ No newline at end of file
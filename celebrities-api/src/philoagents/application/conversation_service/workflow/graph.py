@@ -9,7 +9,7 @@ from philoagents.application.conversation_service.workflow.edges import (
 from philoagents.application.conversation_service.workflow.nodes import (
     conversation_node,
     summarize_conversation_node,
-    retriever_node,
+    get_retriever_node,
     summarize_context_node,
     connector_node,
 )
@@ -22,7 +22,7 @@ def create_workflow_graph():
 
     # Add all nodes
     graph_builder.add_node("conversation_node", conversation_node)
-    graph_builder.add_node("retrieve_celeb_context", retriever_node)
+    graph_builder.add_node("retrieve_celeb_context", get_retriever_node())
     graph_builder.add_node("summarize_conversation_node", summarize_conversation_node)
     graph_builder.add_node("summarize_context_node", summarize_context_node)
     graph_builder.add_node("connector_node", connector_node)
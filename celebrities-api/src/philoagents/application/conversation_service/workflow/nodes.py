@@ -1,4 +1,7 @@
-from langchain_core.messages import RemoveMessage
+import asyncio
+from functools import lru_cache
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, RemoveMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.prebuilt import ToolNode
 
@@ -8,19 +11,41 @@ from philoagents.application.conversation_service.workflow.chains import (
     get_celeb_response_chain,
 )
 from philoagents.application.conversation_service.workflow.state import CelebState
-from philoagents.application.conversation_service.workflow.tools import tools
+from philoagents.application.conversation_service.workflow.tools import (
+    get_query_embedding_model,
+    get_tools,
+)
+from philoagents.application.rag.semantic_cache import SemanticCache
 from philoagents.config import settings
 
-retriever_node = ToolNode(tools)
+
+def get_retriever_node() -> ToolNode:
+    return ToolNode(get_tools())
 
 
 async def conversation_node(state: CelebState, config: RunnableConfig):
     summary = state.get("summary", "")
+    messages = state["messages"]
     conversation_chain = get_celeb_response_chain()
 
+    # Repeated opening questions to the same celeb are answered from the cache,
+    # skipping the LLM call.
+    celeb_id = config.get("configurable", {}).get("celeb_id")
+    cache_key = _get_response_cache_key(messages, summary)
+    if celeb_id is not None and cache_key is not None:
+        response_cache = _get_response_cache(celeb_id)
+        # The first call loads the embedding model and connects to MongoDB, so it
+        # runs off the event loop.
+        embedding_model = await asyncio.to_thread(get_query_embedding_model)
+        embedding = await embedding_model.aembed_query(cache_key)
+        if (cached_response := response_cache.lookup(embedding)) is not None:
+            return {"messages": AIMessage(content=cached_response)}
+    else:
+        response_cache = None
+
     response = await conversation_chain.ainvoke(
         {
-            "messages": state["messages"],
+            "messages": messages,
             "celeb_context": state["celeb_context"],
             "celeb_name": state["celeb_name"],
             "celeb_perspective": state["celeb_perspective"],
@@ -29,25 +54,57 @@ async def conversation_node(state: CelebState, config: RunnableConfig):
         },
         config,
     )
-    
+
+    # Tool calls depend on the rest of the turn, so only final answers are cached.
+    if response_cache is not None and not response.tool_calls:
+        response_cache.insert(embedding, response.content)
+
     return {"messages": response}
 
 
+@lru_cache(maxsize=32)
+def _get_response_cache(celeb_id: str) -> SemanticCache[str]:
+    return SemanticCache(
+        dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM,
+        max_size=settings.RESPONSE_CACHE_SIZE,
+        threshold=settings.RESPONSE_CACHE_THRESHOLD,
+    )
+
+
+def _get_response_cache_key(messages: list[AnyMessage], summary: str) -> str | None:
+    # Answers that depend on earlier turns can't be shared across conversations, so
+    # only the opening question of a conversation is cached. The key stays the same
+    # while the model answers it with tool results.
+    if summary:
+        return None
+
+    human_messages = [
+        message for message in messages if isinstance(message, HumanMessage)
+    ]
+    if len(human_messages) != 1:
+        return None
+
+    return human_messages[0].content
+
+
 async def summarize_conversation_node(state: CelebState):
     summary = state.get("summary", "")
     summary_chain = get_conversation_summary_chain(summary)
 
+    messages = state["messages"]
+
     response = await summary_chain.ainvoke(
         {
-            "messages": state["messages"],
+            "messages": messages,
             "celeb_name": state["celeb_name"],
             "summary": summary,
         }
     )
 
+    # Index into the history instead of slicing it, which would copy the list.
+    total_messages_to_delete = len(messages) - settings.TOTAL_MESSAGES_AFTER_SUMMARY
     delete_messages = [
-        RemoveMessage(id=m.id)
-        for m in state["messages"][: -settings.TOTAL_MESSAGES_AFTER_SUMMARY]
+        RemoveMessage(id=messages[i].id) for i in range(total_messages_to_delete)
     ]
     return {"summary": response.content, "messages": delete_messages}
 
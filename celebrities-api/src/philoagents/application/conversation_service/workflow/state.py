@@ -24,7 +24,11 @@ def state_to_str(state: CelebState) -> str:
     if "summary" in state and bool(state["summary"]):
         conversation = state["summary"]
     elif "messages" in state and bool(state["messages"]):
-        conversation = state["messages"]
+        # Render only the message contents. The repr of a message also includes
+        # its ids, tool call payloads and response metadata.
+        conversation = "\n".join(
+            f"{message.type}: {message.content}" for message in state["messages"]
+        )
     else:
         conversation = ""
 
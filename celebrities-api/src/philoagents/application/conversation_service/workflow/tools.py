@@ -1,23 +1,120 @@
-from langchain.tools.retriever import create_retriever_tool
-from langchain_community.tools import DuckDuckGoSearchRun
+import asyncio
+from functools import lru_cache
 
-from philoagents.application.rag.retrievers import get_retriever
-from philoagents.config import settings
+from duckduckgo_search import DDGS
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, tool
 
-retriever = get_retriever(
-    embedding_model_id=settings.RAG_TEXT_EMBEDDING_MODEL_ID,
-    k=settings.RAG_TOP_K,
-    device=settings.RAG_DEVICE,
+from philoagents.application.rag.retrievers import Retriever, get_retriever
+from philoagents.application.rag.semantic_cache import (
+    SemanticCache,
+    SemanticCachingRetriever,
 )
+from philoagents.config import settings
+
+
+@lru_cache(maxsize=1)
+def _base_retriever() -> Retriever:
+    return get_retriever(
+        embedding_model_id=settings.RAG_TEXT_EMBEDDING_MODEL_ID,
+        k=settings.RAG_TOP_K,
+        device=settings.RAG_DEVICE,
+    )
+
+
+def get_query_embedding_model() -> Embeddings:
+    """Returns the memoized embedding model used to embed retrieval queries.
+
+    Returns:
+        Embeddings: The embedding model shared with the retriever.
+    """
+
+    return _base_retriever().vectorstore.embeddings
+
+
+@lru_cache(maxsize=32)
+def _retriever(celeb_id: str | None) -> BaseRetriever:
+    retriever = _base_retriever()
+    if celeb_id is not None:
+        # Push the celeb filter into $vectorSearch, so only that celeb's chunks are
+        # searched. The copy shares the vector store and its embedding model.
+        pre_filter = {"celeb_id": celeb_id}
+
+        # Scoring every chunk of a celeb with few chunks is about as fast as walking
+        # the HNSW graph, and has perfect recall. The choice is made once per celeb
+        # and kept until the process restarts, so restart the API after rebuilding
+        # the long-term memory.
+        total_chunks = retriever.collection.count_documents(pre_filter)
+        exact = total_chunks <= settings.RAG_EXACT_SEARCH_MAX_DOCUMENTS
+
+        retriever = retriever.model_copy(
+            update={"pre_filter": pre_filter, "exact": exact}
+        )
 
-retriever_tool = create_retriever_tool(
-    retriever,
+    # Each celeb gets its own semantic cache, so a query can't be answered with
+    # documents retrieved for another celeb.
+    cache = SemanticCache(
+        dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM,
+        max_size=settings.RAG_SEMANTIC_CACHE_SIZE,
+        threshold=settings.RAG_SEMANTIC_CACHE_THRESHOLD,
+    )
+
+    # Reuse the retriever's memoized embedder, so the semantic cache lookup and the
+    # vector search on a cache miss share a single forward pass per query.
+    return SemanticCachingRetriever(
+        retriever=retriever,
+        embedding_model=retriever.vectorstore.embeddings,
+        cache=cache,
+    )
+
+
+@tool(
     "retrieve_celeb_context",
-    "Search and return information about a specific celeb. Always use this tool when the user asks you about a celeb, their work, accomplishments or journey.",
+    description="Search and return information about a specific celeb. Always use this tool when the user asks you about a celeb, their work, accomplishments or journey.",
 )
+async def retrieve_celeb_context_tool(query: str, config: RunnableConfig) -> str:
+    celeb_id = config.get("configurable", {}).get("celeb_id")
+    # Building a celeb's retriever the first time counts their chunks with a
+    # blocking query, so it runs off the event loop.
+    retriever = await asyncio.to_thread(_retriever, celeb_id)
+    documents = await retriever.ainvoke(query, config)
+
+    return "\n\n".join(document.page_content for document in documents)
+
+
+@lru_cache(maxsize=1)
+def _ddgs() -> DDGS:
+    # A single client keeps its connections to DuckDuckGo alive between searches,
+    # instead of paying a new TLS handshake on every tool call.
+    return DDGS(timeout=10)
 
-duckduckgo_search_tool = DuckDuckGoSearchRun(
-    description="Always use this tool when the user asks about latest/current information about a celeb or their work."
+
+@tool(
+    "duckduckgo_search",
+    description="Always use this tool when the user asks about latest/current information about a celeb or their work.",
 )
+def duckduckgo_search_tool(query: str) -> str:
+    # Same search settings as langchain's DuckDuckGoSearchAPIWrapper defaults, which
+    # keep the results to the past year.
+    results = _ddgs().text(
+        query, region="wt-wt", safesearch="moderate", timelimit="y", max_results=5
+    )
+    if not results:
+        return "No good DuckDuckGo Search Result was found"
+
+    return " ".join(result["body"] for result in results)
+
+
+def get_tools() -> list[BaseTool]:
+    """Returns the tools available to the agent.
+
+    The retriever tool is scoped to the celeb set as `celeb_id` in the run's
+    configurable, and its retrievers are built lazily on first use.
+
+    Returns:
+        list[BaseTool]: The retriever and web search tools available to the agent.
+    """
 
-tools = [retriever_tool, duckduckgo_search_tool]
+    return [retrieve_celeb_context_tool, duckduckgo_search_tool]
@@ -1,28 +1,55 @@
-from typing import Generator
+import asyncio
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
 
-from langchain_community.document_loaders import WebBaseLoader, WikipediaLoader
+import aiohttp
+import orjson
+from langchain_community.document_loaders.web_base import default_header_template
 from langchain_core.documents import Document
+from loguru import logger
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 
 from philoagents.domain.celeb import Celeb, CelebExtract
 from philoagents.domain.celeb_factory import CelebFactory
 
+# Pages with less text than this (e.g., when the selector matches nothing) are not
+# worth embedding and storing.
+MIN_DOCUMENT_LENGTH = 200
 
-def get_extraction_generator(
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=10)
+FETCH_MAX_RETRIES = 3
+FETCH_BACKOFF_SECONDS = 1.0
+
+T = TypeVar("T")
+
+
+async def get_extraction_generator(
     celebs: list[CelebExtract],
-) -> Generator[tuple[Celeb, list[Document]], None, None]:
+    max_concurrency: int = 4,
+) -> AsyncGenerator[tuple[Celeb, list[Document]], None]:
     """Extract documents for a list of celebs, yielding one at a time.
 
+    Celebs are extracted concurrently by background tasks that push their results
+    into a bounded queue, so extraction keeps running while the consumer processes
+    the documents already yielded. Results are yielded in completion order.
+
     Args:
         celebs: A list of CelebExtract objects containing celeb information.
+        max_concurrency: Maximum number of celebs extracted or waiting in the
+            queue at the same time. Defaults to 4.
 
     Yields:
         tuple[Celeb, list[Document]]: A tuple containing the celeb object and a list of
             documents extracted for that celeb.
+
+    Raises:
+        Exception: Any error raised while extracting the documents of a celeb.
     """
 
     progress_bar = tqdm(
-        celebs,
+        total=len(celebs),
         desc="Extracting docs",
         unit="celeb",
         bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
@@ -32,94 +59,241 @@ def get_extraction_generator(
     )
 
     celebs_factory = CelebFactory()
-    for celeb_extract in progress_bar:
-        celeb = celebs_factory.get_celeb(celeb_extract.id)
-        progress_bar.set_postfix_str(f"Celeb: {celeb.name}")
+    queue: asyncio.Queue[tuple[Celeb, list[Document]] | Exception] = asyncio.Queue(
+        maxsize=max_concurrency
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with get_http_session() as session:
+
+        async def extract_one(celeb_extract: CelebExtract) -> None:
+            async with semaphore:
+                try:
+                    celeb = celebs_factory.get_celeb(celeb_extract.id)
+                    celeb_docs = await extract(celeb, celeb_extract.urls, session)
+                except Exception as e:
+                    await queue.put(e)
+                else:
+                    await queue.put((celeb, celeb_docs))
+
+        tasks = [
+            asyncio.create_task(extract_one(celeb_extract)) for celeb_extract in celebs
+        ]
+        try:
+            for _ in range(len(celebs)):
+                result = await queue.get()
+                if isinstance(result, Exception):
+                    raise result
+
+                celeb, celeb_docs = result
+                progress_bar.set_postfix_str(f"Celeb: {celeb.name}")
+                progress_bar.update()
+
+                yield (celeb, celeb_docs)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            progress_bar.close()
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Create an HTTP session that keeps connections alive across fetches.
+
+    Returns:
+        aiohttp.ClientSession: A session with browser-like headers, a timeout and a
+            pooled connector opening at most 4 connections per host.
+    """
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=4),
+        headers=default_header_template,
+        timeout=HTTP_TIMEOUT,
+    )
 
-        celeb_docs = extract(celeb, celeb_extract.urls)
 
-        yield (celeb, celeb_docs)
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    read: Callable[[aiohttp.ClientResponse], Awaitable[T]],
+    max_retries: int = FETCH_MAX_RETRIES,
+    **kwargs,
+) -> T:
+    """Fetch a URL, retrying transient failures with exponential backoff.
 
+    Connection errors, timeouts, rate limiting and server errors are retried. Other
+    HTTP errors are raised right away.
 
-def extract(celeb: Celeb, extract_urls: list[str]) -> list[Document]:
+    Args:
+        session: HTTP session used to fetch the URL.
+        url: URL to fetch.
+        read: Coroutine function reading the body of the response, e.g.
+            `aiohttp.ClientResponse.text`.
+        max_retries: Maximum number of retries after the first attempt. Defaults to 3.
+        **kwargs: Additional arguments passed to `session.get`.
+
+    Returns:
+        T: The body of the response, as returned by `read`.
+
+    Raises:
+        aiohttp.ClientError: If the request fails with a non-transient error, or
+            still fails after the last retry.
+        asyncio.TimeoutError: If the last retry times out.
+    """
+
+    for attempt in range(max_retries + 1):
+        try:
+            async with session.get(url, **kwargs) as response:
+                response.raise_for_status()
+
+                return await read(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            is_transient = not isinstance(e, aiohttp.ClientResponseError) or (
+                e.status == 429 or e.status >= 500
+            )
+            if not is_transient or attempt == max_retries:
+                raise
+
+            delay = FETCH_BACKOFF_SECONDS * 2**attempt
+            logger.debug(f"Retrying '{url}' in {delay:.0f}s after error: {e!r}")
+            await asyncio.sleep(delay)
+
+
+async def extract(
+    celeb: Celeb, extract_urls: list[str], session: aiohttp.ClientSession
+) -> list[Document]:
     """Extract documents for a single celeb from all sources and deduplicate them.
 
     Args:
         celeb: Celeb object containing celeb information.
         extract_urls: List of URLs to extract content from.
+        session: HTTP session used to fetch the URLs.
 
     Returns:
         list[Document]: List of deduplicated documents extracted for the celeb.
     """
 
-    docs = []
-
-    docs.extend(extract_wikipedia(celeb))
-    docs.extend(extract_brittanica(celeb, extract_urls))
+    wikipedia_docs, brittanica_docs = await asyncio.gather(
+        extract_wikipedia(celeb, session),
+        extract_brittanica(celeb, extract_urls, session),
+    )
 
-    return docs
+    return [*wikipedia_docs, *brittanica_docs]
 
 
-def extract_wikipedia(celeb: Celeb) -> list[Document]:
+async def extract_wikipedia(
+    celeb: Celeb, session: aiohttp.ClientSession
+) -> list[Document]:
     """Extract documents for a single celeb from Wikipedia.
 
+    The best matching page is searched for and its plain-text extract is fetched
+    in a single MediaWiki API request.
+
     Args:
         celeb: Celeb object containing celeb information.
+        session: HTTP session used to call the MediaWiki API.
 
     Returns:
         list[Document]: List of documents extracted from Wikipedia for the celeb.
     """
 
-    loader = WikipediaLoader(
-        query=celeb.name,
-        lang="en",
-        load_max_docs=1,
-        doc_content_chars_max=1000000,
-    )
-    docs = loader.load()
+    params = {
+        "action": "query",
+        "format": "json",
+        "generator": "search",
+        "gsrsearch": celeb.name,
+        "gsrlimit": "1",
+        "prop": "extracts",
+        "explaintext": "1",
+        "redirects": "1",
+    }
+    try:
+        content = await fetch(
+            session,
+            WIKIPEDIA_API_URL,
+            aiohttp.ClientResponse.read,
+            params=params,
+            headers={"Accept-Encoding": "gzip"},
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"Skipping Wikipedia for '{celeb.name}': {e!r}")
+
+        return []
+
+    data = orjson.loads(content)
 
-    for doc in docs:
-        doc.metadata["celeb_id"] = celeb.id
-        doc.metadata["celeb_name"] = celeb.name
+    pages = data.get("query", {}).get("pages", {})
+    documents = []
+    for page in pages.values():
+        text = page.get("extract", "")
+        if len(text) < MIN_DOCUMENT_LENGTH:
+            logger.warning(
+                f"Skipping Wikipedia page for '{celeb.name}': extracted text is too short."
+            )
 
-    return docs
+            continue
 
+        metadata = {
+            "source": "wikipedia",
+            "celeb_id": celeb.id,
+            "celeb_name": celeb.name,
+            "title": page["title"],
+        }
+        documents.append(Document(page_content=text, metadata=metadata))
 
-def extract_brittanica(celeb: Celeb, urls: list[str]) -> list[Document]:
+    return documents
+
+
+async def extract_brittanica(
+    celeb: Celeb, urls: list[str], session: aiohttp.ClientSession
+) -> list[Document]:
     """Extract documents for a single celeb from Stanford Encyclopedia of Philosophy.
 
+    The URLs are fetched concurrently over the shared session. URLs that still fail
+    after retrying are logged and skipped.
+
     Args:
         celeb: Celeb object containing celeb information.
         urls: List of URLs to extract content from.
+        session: HTTP session used to fetch the URLs.
 
     Returns:
         list[Document]: List of documents extracted from Stanford Encyclopedia for the celeb.
     """
 
-    def extract_paragraphs_and_headers(soup) -> str:
-        content = []
-        for element in soup.find_all("p.topic-paragraph"):
-            content.append(element.get_text())
-
-        return "\n\n".join(content)
+    def extract_paragraphs_and_headers(tree: LexborHTMLParser) -> str:
+        return "\n\n".join(node.text() for node in tree.css("p.topic-paragraph"))
 
     if len(urls) == 0:
         return []
 
-    loader = WebBaseLoader(show_progress=False)
-    soups = loader.scrape_all(urls)
+    htmls = await asyncio.gather(
+        *(fetch(session, url, aiohttp.ClientResponse.text) for url in urls),
+        return_exceptions=True,
+    )
 
     documents = []
-    for url, soup in zip(urls, soups):
-        text = extract_paragraphs_and_headers(soup)
+    for url, html in zip(urls, htmls):
+        if isinstance(html, BaseException):
+            logger.warning(f"Skipping '{url}': {html!r}")
+
+            continue
+
+        tree = LexborHTMLParser(html)
+        text = extract_paragraphs_and_headers(tree)
+        if len(text) < MIN_DOCUMENT_LENGTH:
+            logger.warning(f"Skipping '{url}': extracted text is too short.")
+
+            continue
+
         metadata = {
             "source": url,
             "celeb_id": celeb.id,
             "celeb_name": celeb.name,
         }
 
-        if title := soup.find("title"):
-            metadata["title"] = title.get_text().strip(" \n")
+        if title := tree.css_first("title"):
+            metadata["title"] = title.text().strip(" \n")
 
         documents.append(Document(page_content=text, metadata=metadata))
 
@@ -127,12 +301,18 @@ def extract_brittanica(celeb: Celeb, urls: list[str]) -> list[Document]:
 
 
 if __name__ == "__main__":
-    trump = CelebFactory().get_celeb("trump")
-    docs = extract_brittanica(
-        trump,
-        [
-            "https://www.britannica.com/biography/Donald-Trump",
-            "https://www.britannica.com/biography/Donald-Trump",
-        ],
-    )
+
+    async def main() -> list[Document]:
+        trump = CelebFactory().get_celeb("trump")
+        async with get_http_session() as session:
+            return await extract_brittanica(
+                trump,
+                [
+                    "https://www.britannica.com/biography/Donald-Trump",
+                    "https://www.britannica.com/biography/Donald-Trump",
+                ],
+                session,
+            )
+
+    docs = asyncio.run(main())
     print(docs)
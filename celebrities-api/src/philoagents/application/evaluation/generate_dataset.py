@@ -1,4 +1,4 @@
-import time
+import asyncio
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
@@ -22,15 +22,17 @@ class EvaluationDatasetGenerator:
         self.__chain = self.__build_chain()
         self.__splitter = self.__build_splitter()
 
-    def __call__(self, celebs: list[CelebExtract]) -> EvaluationDataset:
+    async def __call__(self, celebs: list[CelebExtract]) -> EvaluationDataset:
         dataset_samples = []
         extraction_generator = get_extraction_generator(celebs)
-        for celeb, docs in extraction_generator:
+        async for celeb, docs in extraction_generator:
             chunks = self.__splitter.split_documents(docs)
             for chunk in chunks[:4]:
                 try:
-                    dataset_sample: EvaluationDatasetSample = self.__chain.invoke(
-                        {"celeb": celeb, "document": chunk.page_content}
+                    dataset_sample: EvaluationDatasetSample = (
+                        await self.__chain.ainvoke(
+                            {"celeb": celeb, "document": chunk.page_content}
+                        )
                     )
                 except Exception as e:
                     logger.error(f"Error generating dataset sample: {e}")
@@ -41,7 +43,7 @@ class EvaluationDatasetGenerator:
                 if self.__validate_sample(dataset_sample):
                     dataset_samples.append(dataset_sample)
 
-                time.sleep(1)  # To avoid rate limiting
+                await asyncio.sleep(1)  # To avoid rate limiting
 
                 if len(dataset_samples) >= self.max_samples:
                     break
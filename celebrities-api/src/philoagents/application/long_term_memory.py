@@ -1,3 +1,7 @@
+import asyncio
+
+import numpy as np
+from bson.binary import VECTOR_SUBTYPE, Binary, BinaryVectorDtype
 from langchain_core.documents import Document
 from loguru import logger
 
@@ -8,6 +12,9 @@ from philoagents.config import settings
 from philoagents.domain.celeb import CelebExtract
 from philoagents.infrastructure.mongo import MongoClientWrapper, MongoIndex
 
+# Header of a BSON float32 vector: the dtype byte followed by a zero padding byte.
+FLOAT32_VECTOR_HEADER = BinaryVectorDtype.FLOAT32.value + b"\x00"
+
 
 class LongTermMemoryCreator:
     def __init__(self, retriever: Retriever, splitter: Splitter) -> None:
@@ -25,39 +32,78 @@ class LongTermMemoryCreator:
 
         return cls(retriever, splitter)
 
-    def __call__(self, celebs: list[CelebExtract]) -> None:
+    async def __call__(
+        self, celebs: list[CelebExtract], drop_indexes: bool = False
+    ) -> None:
         if len(celebs) == 0:
             logger.warning("No celebs to extract. Exiting.")
 
             return
 
-        # First clear the long term memory collection to avoid duplicates.
         with MongoClientWrapper(
             model=Document, collection_name=settings.MONGO_LONG_TERM_MEMORY_COLLECTION
         ) as client:
+            # First clear the long term memory collection to avoid duplicates.
             client.clear_collection()
 
-        extraction_generator = get_extraction_generator(celebs)
-        for _, docs in extraction_generator:
-            chunked_docs = self.splitter.split_documents(docs)
+            index = MongoIndex(retriever=self.retriever, mongodb_client=client)
+            with index.bulk_load(
+                is_hybrid=True,
+                embedding_dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM,
+                quantization=settings.MONGO_VECTOR_QUANTIZATION,
+                drop_indexes=drop_indexes,
+            ):
+                extraction_generator = get_extraction_generator(celebs)
+                async for _, docs in extraction_generator:
+                    # Ingest in a worker thread so the extraction of the next celebs
+                    # keeps running on the event loop while this batch is embedded.
+                    await asyncio.to_thread(self.__ingest, docs)
+
+    def __ingest(self, docs: list[Document]) -> None:
+        chunked_docs = self.splitter.split_documents(docs)
+
+        chunked_docs = deduplicate_documents(chunked_docs, threshold=0.7)
+
+        # A single call lets the model sort all the chunks by length before batching
+        # them, which minimizes padding across the whole celeb.
+        embeddings = self.retriever.vectorstore.embeddings.embed_documents(
+            [doc.page_content for doc in chunked_docs]
+        )
+        self.__add_documents(chunked_docs, embeddings)
 
-            chunked_docs = deduplicate_documents(chunked_docs, threshold=0.7)
+    def __add_documents(
+        self, documents: list[Document], embeddings: list[list[float]]
+    ) -> None:
+        """Inserts documents with precomputed embeddings, so they are not re-embedded.
 
-            self.retriever.vectorstore.add_documents(chunked_docs)
+        Embeddings are stored as packed float32 BSON vectors by default, which are
+        several times smaller on the wire and on disk than arrays of doubles.
+        """
 
-        self.__create_index()
+        if not documents:
+            return
 
-    def __create_index(self) -> None:
-        with MongoClientWrapper(
-            model=Document, collection_name=settings.MONGO_LONG_TERM_MEMORY_COLLECTION
-        ) as client:
-            self.index = MongoIndex(
-                retriever=self.retriever,
-                mongodb_client=client,
-            )
-            self.index.create(
-                is_hybrid=True, embedding_dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM
-            )
+        if settings.MONGO_BINARY_VECTORS:
+            # Pack all the vectors at once with numpy instead of struct-packing the
+            # floats of every vector in Python, as Binary.from_vector does.
+            vectors = np.asarray(embeddings, dtype="<f4")
+            embeddings = [
+                Binary(FLOAT32_VECTOR_HEADER + vector.tobytes(), VECTOR_SUBTYPE)
+                for vector in vectors
+            ]
+
+        vectorstore = self.retriever.vectorstore
+        vectorstore.collection.insert_many(
+            [
+                {
+                    vectorstore._text_key: doc.page_content,
+                    vectorstore._embedding_key: embedding,
+                    **doc.metadata,
+                }
+                for doc, embedding in zip(documents, embeddings)
+            ],
+            ordered=False,
+        )
 
 
 class LongTermMemoryRetriever:
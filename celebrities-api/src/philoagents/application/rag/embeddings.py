@@ -1,11 +1,198 @@
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+
+from langchain_core.embeddings import Embeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 
 EmbeddingsModel = HuggingFaceEmbeddings
 
+ONNX_INT8_MODEL_FILE_NAME = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that memoizes query embeddings in a thread-safe LRU cache.
+
+    Document embeddings are forwarded untouched, while query embeddings are keyed
+    by a hash of the normalized query text, so repeated questions skip the model
+    forward pass.
+
+    Args:
+        embedding_model (Embeddings): The underlying embedding model.
+        max_size (int): Maximum number of query embeddings kept in memory.
+    """
+
+    def __init__(self, embedding_model: Embeddings, max_size: int = 1024) -> None:
+        self.embedding_model = embedding_model
+        self.max_size = max_size
+
+        self.__cache: OrderedDict[str, list[float]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embedding_model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self.__cache_key(text)
+
+        embedding = self.__lookup(key)
+        if embedding is None:
+            embedding = self.embedding_model.embed_query(text)
+            self.__store(key, embedding)
+
+        return embedding
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self.__cache_key(text)
+
+        embedding = self.__lookup(key)
+        if embedding is None:
+            embedding = await self.embedding_model.aembed_query(text)
+            self.__store(key, embedding)
+
+        return embedding
+
+    def __lookup(self, key: str) -> list[float] | None:
+        with self.__lock:
+            embedding = self.__cache.get(key)
+            if embedding is not None:
+                self.__cache.move_to_end(key)
+
+            return embedding
+
+    def __store(self, key: str, embedding: list[float]) -> None:
+        with self.__lock:
+            self.__cache[key] = embedding
+            self.__cache.move_to_end(key)
+            if len(self.__cache) > self.max_size:
+                self.__cache.popitem(last=False)
+
+    def __cache_key(self, text: str) -> str:
+        return hashlib.sha1(text.strip().lower().encode("utf-8")).hexdigest()
+
+
+class MicrobatchingEmbeddings(Embeddings):
+    """Embeddings wrapper that coalesces concurrent async queries into one batch.
+
+    Queries awaiting an embedding are collected until `max_batch_size` of them are
+    pending or `max_wait_ms` has passed since the first one, then embedded with a
+    single `embed_documents` call in a worker thread. Concurrent conversations
+    share one forward pass instead of each running their own. Synchronous calls
+    are forwarded untouched.
+
+    Batches are only collected on one event loop at a time, the first one to send a
+    query. Queries from other loops, such as `asyncio.run` calls on other threads,
+    are embedded directly in a worker thread. Once the owning loop is closed, the
+    next loop to send a query takes over and the queries left pending on the
+    closed loop are dropped.
+
+    The wrapped model must embed queries and documents the same way, which holds
+    for the sentence-transformers models used here.
+
+    Args:
+        embedding_model (Embeddings): The underlying embedding model.
+        max_batch_size (int): Number of pending queries that triggers a batch.
+        max_wait_ms (float): Maximum time a query waits for others to join its batch.
+    """
+
+    def __init__(
+        self,
+        embedding_model: Embeddings,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        self.embedding_model = embedding_model
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self.__flush_handle: asyncio.TimerHandle | None = None
+        self.__tasks: set[asyncio.Task] = set()
+        self.__lock = threading.RLock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embedding_model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embedding_model.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+
+        with self.__lock:
+            if self.__loop is None or self.__loop.is_closed():
+                self.__bind(loop)
+
+            future = None
+            if self.__loop is loop:
+                future = loop.create_future()
+                self.__pending.append((text, future))
+
+                if len(self.__pending) >= self.max_batch_size:
+                    self.__flush()
+                elif self.__flush_handle is None:
+                    self.__flush_handle = loop.call_later(
+                        self.max_wait_ms / 1000, self.__flush
+                    )
+
+        if future is None:
+            return await asyncio.to_thread(self.embedding_model.embed_query, text)
+
+        return await future
+
+    def __bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The futures and timer left by a closed loop can never complete, so they
+        # are dropped along with it.
+        self.__loop = loop
+        self.__pending = []
+        self.__flush_handle = None
+        self.__tasks = set()
+
+    def __flush(self) -> None:
+        with self.__lock:
+            if self.__flush_handle is not None:
+                self.__flush_handle.cancel()
+                self.__flush_handle = None
+
+            # Queries cancelled while waiting don't need to be embedded.
+            batch = [
+                (text, future) for text, future in self.__pending if not future.done()
+            ]
+            self.__pending = []
+            if not batch:
+                return
+
+            # Keep a reference to the task, so it isn't garbage collected mid-flight.
+            task = asyncio.ensure_future(self.__embed_batch(batch))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def __embed_batch(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        try:
+            embeddings = await asyncio.to_thread(
+                self.embedding_model.embed_documents, [text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
 
 def get_embedding_model(
     model_id: str,
     device: str = "cpu",
+    backend: str = "hf",
+    batch_size: int = 64,
 ) -> EmbeddingsModel:
     """Gets an instance of a HuggingFace embedding model.
 
@@ -13,21 +200,28 @@ def get_embedding_model(
         model_id (str): The ID/name of the HuggingFace embedding model to use
         device (str): The compute device to run the model on (e.g. "cpu", "cuda").
             Defaults to "cpu"
+        backend (str): The inference backend, either "hf" (PyTorch) or "onnx_int8"
+            (int8-quantized ONNX Runtime). Defaults to "hf"
+        batch_size (int): Number of texts encoded per forward pass. Defaults to 64
 
     Returns:
         EmbeddingsModel: A configured HuggingFace embeddings model instance
     """
-    return get_huggingface_embedding_model(model_id, device)
+    if backend == "onnx_int8":
+        return get_onnx_int8_embedding_model(model_id, device, batch_size)
+
+    return get_huggingface_embedding_model(model_id, device, batch_size)
 
 
 def get_huggingface_embedding_model(
-    model_id: str, device: str
+    model_id: str, device: str, batch_size: int = 64
 ) -> HuggingFaceEmbeddings:
     """Gets a HuggingFace embedding model instance.
 
     Args:
         model_id (str): The ID/name of the HuggingFace embedding model to use
         device (str): The compute device to run the model on (e.g. "cpu", "cuda")
+        batch_size (int): Number of texts encoded per forward pass. Defaults to 64
 
     Returns:
         HuggingFaceEmbeddings: A configured HuggingFace embeddings model instance
@@ -36,5 +230,34 @@ def get_huggingface_embedding_model(
     return HuggingFaceEmbeddings(
         model_name=model_id,
         model_kwargs={"device": device, "trust_remote_code": True},
-        encode_kwargs={"normalize_embeddings": False},
+        encode_kwargs={"normalize_embeddings": False, "batch_size": batch_size},
+    )
+
+
+def get_onnx_int8_embedding_model(
+    model_id: str, device: str, batch_size: int = 64
+) -> HuggingFaceEmbeddings:
+    """Gets a HuggingFace embedding model instance running int8 weights on ONNX Runtime.
+
+    The model must ship a dynamically quantized ONNX file (the sentence-transformers
+    models on the Hub do, otherwise use `tools/quantize_embedding_model.py`).
+
+    Args:
+        model_id (str): The ID/name or local path of the HuggingFace embedding model
+        device (str): The compute device to run the model on (e.g. "cpu", "cuda")
+        batch_size (int): Number of texts encoded per forward pass. Defaults to 64
+
+    Returns:
+        HuggingFaceEmbeddings: A configured HuggingFace embeddings model instance
+            backed by ONNX Runtime with embedding normalization disabled
+    """
+    return HuggingFaceEmbeddings(
+        model_name=model_id,
+        model_kwargs={
+            "device": device,
+            "trust_remote_code": True,
+            "backend": "onnx",
+            "model_kwargs": {"file_name": ONNX_INT8_MODEL_FILE_NAME},
+        },
+        encode_kwargs={"normalize_embeddings": False, "batch_size": batch_size},
     )
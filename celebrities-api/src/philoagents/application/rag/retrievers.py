@@ -1,15 +1,156 @@
-from langchain_huggingface import HuggingFaceEmbeddings
+from typing import Any, Iterable
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_mongodb import MongoDBAtlasVectorSearch
+from langchain_mongodb.pipelines import (
+    combine_pipelines,
+    final_hybrid_stage,
+    reciprocal_rank_stage,
+    vector_search_stage,
+)
 from langchain_mongodb.retrievers import (
     MongoDBAtlasHybridSearchRetriever,
 )
+from langchain_mongodb.utils import make_serializable
 from loguru import logger
 
 from philoagents.config import settings
+from philoagents.infrastructure.mongo import acquire_client
+
+from .embeddings import CachedEmbeddings, MicrobatchingEmbeddings, get_embedding_model
+
+
+class FilteredHybridSearchRetriever(MongoDBAtlasHybridSearchRetriever):
+    """Hybrid search retriever that pushes equality pre-filters into both searches.
+
+    Vector and full-text results are fused with Reciprocal Rank Fusion, as in the
+    base retriever. The base retriever applies `pre_filter` to the full-text search
+    as a `$match` after `$search`, so every text match of every celeb is fetched
+    before being filtered. Here, equality filters run inside `$search` as `equals`
+    clauses instead, which requires the filtered fields to be indexed as tokens in
+    the full-text search index.
+
+    The vector search is approximate (HNSW) by default. Set `exact` to run an exact
+    nearest neighbor search instead, which is cheap and has perfect recall when
+    the filter leaves only a few thousand candidate vectors.
+    """
+
+    exact: bool = False
+    """If true, the vector search scores every candidate instead of using HNSW."""
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> list[Document]:
+        k = kwargs.get("k", self.k)
+
+        # There is nothing to rank an empty query by, so skip embedding it and return
+        # the documents matching the filter instead.
+        if not query.strip():
+            return self.__fetch_documents(k)
+
+        query_vector = self.vectorstore._embedding.embed_query(query)
+
+        pipeline: list[dict[str, Any]] = []
+
+        vector_pipeline = [
+            self.__vector_search_stage(query_vector, k),
+            *reciprocal_rank_stage("vector_score", self.vector_penalty),
+        ]
+        combine_pipelines(pipeline, vector_pipeline, self.collection.name)
+
+        text_pipeline = [
+            *self.__text_search_stage(query, k),
+            *reciprocal_rank_stage("fulltext_score", self.fulltext_penalty),
+        ]
+        combine_pipelines(pipeline, text_pipeline, self.collection.name)
 
-from .embeddings import get_embedding_model
+        pipeline.extend(
+            final_hybrid_stage(
+                scores_fields=["vector_score", "fulltext_score"], limit=k
+            )
+        )
+        if not self.show_embeddings:
+            pipeline.append({"$project": {self.vectorstore._embedding_key: 0}})
+        if self.post_filter is not None:
+            pipeline.extend(self.post_filter)
 
-Retriever = MongoDBAtlasHybridSearchRetriever
+        return self.__to_documents(self.collection.aggregate(pipeline))
+
+    def __fetch_documents(self, k: int) -> list[Document]:
+        cursor = self.collection.find(
+            self.pre_filter or {}, {self.vectorstore._embedding_key: 0}, limit=k
+        )
+
+        return self.__to_documents(cursor)
+
+    def __to_documents(self, results: Iterable[dict[str, Any]]) -> list[Document]:
+        documents = []
+        for result in results:
+            text = result.pop(self.vectorstore._text_key)
+            make_serializable(result)
+            documents.append(Document(page_content=text, metadata=result))
+
+        return documents
+
+    def __vector_search_stage(
+        self, query_vector: list[float], k: int
+    ) -> dict[str, Any]:
+        if not self.exact:
+            return vector_search_stage(
+                query_vector=query_vector,
+                search_field=self.vectorstore._embedding_key,
+                index_name=self.vectorstore._index_name,
+                top_k=k,
+                filter=self.pre_filter,
+                oversampling_factor=self.oversampling_factor,
+            )
+
+        # Exact search takes no numCandidates.
+        stage = {
+            "index": self.vectorstore._index_name,
+            "path": self.vectorstore._embedding_key,
+            "queryVector": query_vector,
+            "exact": True,
+            "limit": k,
+        }
+        if self.pre_filter:
+            stage["filter"] = self.pre_filter
+
+        return {"$vectorSearch": stage}
+
+    def __text_search_stage(self, query: str, k: int) -> list[dict[str, Any]]:
+        pre_filter = self.pre_filter or {}
+        equals_filters = [
+            {"equals": {"path": field, "value": value}}
+            for field, value in pre_filter.items()
+            if not field.startswith("$") and not isinstance(value, dict)
+        ]
+        match_filter = {
+            field: value
+            for field, value in pre_filter.items()
+            if field.startswith("$") or isinstance(value, dict)
+        }
+
+        operator: dict[str, Any] = {
+            "text": {"query": query, "path": self.vectorstore._text_key}
+        }
+        if equals_filters:
+            operator = {"compound": {"must": [operator], "filter": equals_filters}}
+
+        pipeline: list[dict[str, Any]] = [
+            {"$search": {"index": self.search_index_name, **operator}}
+        ]
+        if match_filter:
+            pipeline.append({"$match": match_filter})
+        pipeline.append({"$set": {"score": {"$meta": "searchScore"}}})
+        pipeline.append({"$limit": k})
+
+        return pipeline
+
+
+Retriever = FilteredHybridSearchRetriever
 
 
 def get_retriever(
@@ -31,37 +172,53 @@ def get_retriever(
         f"Initializing retriever | model: {embedding_model_id} | device: {device} | top_k: {k}"
     )
 
-    embedding_model = get_embedding_model(embedding_model_id, device)
+    embedding_model = CachedEmbeddings(
+        MicrobatchingEmbeddings(
+            get_embedding_model(
+                embedding_model_id,
+                device,
+                backend=settings.RAG_EMBED_BACKEND,
+                batch_size=settings.RAG_EMBED_BATCH_SIZE,
+            ),
+            max_batch_size=settings.RAG_EMBED_MICROBATCH_SIZE,
+            max_wait_ms=settings.RAG_EMBED_MICROBATCH_WAIT_MS,
+        ),
+        max_size=settings.RAG_EMBED_CACHE_SIZE,
+    )
 
     return get_hybrid_search_retriever(embedding_model, k)
 
 
 def get_hybrid_search_retriever(
-    embedding_model: HuggingFaceEmbeddings, k: int
-) -> MongoDBAtlasHybridSearchRetriever:
+    embedding_model: Embeddings, k: int
+) -> FilteredHybridSearchRetriever:
     """Creates a MongoDB Atlas hybrid search retriever with the given embedding model.
 
     Args:
-        embedding_model (HuggingFaceEmbeddings): The embedding model to use for vector search.
+        embedding_model (Embeddings): The embedding model to use for vector search.
         k (int): Number of documents to retrieve.
 
     Returns:
-        MongoDBAtlasHybridSearchRetriever: A configured hybrid search retriever using both
+        FilteredHybridSearchRetriever: A configured hybrid search retriever using both
             vector and text search capabilities.
     """
-    vectorstore = MongoDBAtlasVectorSearch.from_connection_string(
-        connection_string=settings.MONGO_URI,
+    # Share the connection pool of the other MongoDB users in the process, instead of
+    # opening a dedicated client. The retriever holds on to it until the process exits.
+    client = acquire_client(settings.MONGO_URI)
+    vectorstore = MongoDBAtlasVectorSearch(
+        collection=client[settings.MONGO_DB_NAME][
+            settings.MONGO_LONG_TERM_MEMORY_COLLECTION
+        ],
         embedding=embedding_model,
-        namespace=f"{settings.MONGO_DB_NAME}.{settings.MONGO_LONG_TERM_MEMORY_COLLECTION}",
         text_key="chunk",
         embedding_key="embedding",
         relevance_score_fn="dotProduct",
     )
 
-    retriever = MongoDBAtlasHybridSearchRetriever(
+    retriever = FilteredHybridSearchRetriever(
         vectorstore=vectorstore,
         search_index_name="hybrid_search_index",
-        top_k=k,
+        k=k,
         vector_penalty=50,
         fulltext_penalty=50,
     )
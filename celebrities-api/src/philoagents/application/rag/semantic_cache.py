@@ -0,0 +1,152 @@
+import threading
+from typing import Generic, TypeVar
+
+import numpy as np
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+V = TypeVar("V")
+
+
+class SemanticCache(Generic[V]):
+    """In-memory semantic cache mapping query embeddings to values, such as the
+    documents retrieved or the response generated for the query.
+
+    Embeddings are stored L2-normalized in a fixed-size ring buffer, so a lookup is
+    a single matrix-vector product followed by an argmax over cosine similarities.
+
+    Args:
+        dim (int): Dimension of the query embeddings.
+        max_size (int): Maximum number of cached queries. The oldest entries are
+            overwritten first.
+        threshold (float): Minimum cosine similarity for a cache hit.
+    """
+
+    def __init__(self, dim: int, max_size: int = 2048, threshold: float = 0.95) -> None:
+        self.dim = dim
+        self.max_size = max_size
+        self.threshold = threshold
+
+        self.__vectors = np.zeros((max_size, dim), dtype=np.float32)
+        self.__values: list[V] = []
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    def lookup(self, embedding: list[float]) -> V | None:
+        """Returns the value cached for the most similar query, if similar enough.
+
+        Args:
+            embedding (list[float]): Embedding of the incoming query.
+
+        Returns:
+            V | None: The cached value on a hit, None on a miss.
+        """
+
+        query = self.__normalize(embedding)
+
+        with self.__lock:
+            size = len(self.__values)
+            if size == 0:
+                return None
+
+            similarities = self.__vectors[:size] @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+
+            return self.__values[best]
+
+    def insert(self, embedding: list[float], value: V) -> None:
+        """Caches the value computed for a query.
+
+        Args:
+            embedding (list[float]): Embedding of the query.
+            value (V): Value computed for the query.
+        """
+
+        query = self.__normalize(embedding)
+
+        with self.__lock:
+            slot = self.__next
+            self.__vectors[slot] = query
+            if slot < len(self.__values):
+                self.__values[slot] = value
+            else:
+                self.__values.append(value)
+
+            self.__next = (slot + 1) % self.max_size
+
+    def __normalize(self, embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+
+        return vector / norm if norm > 0 else vector
+
+
+class SemanticCachingRetriever(BaseRetriever):
+    """Retriever that serves semantically similar queries from a SemanticCache.
+
+    On a hit, the cached documents are returned without querying the vector store.
+    On a miss, the wrapped retriever is called and its results are cached. Empty
+    queries are passed through without being embedded.
+
+    Args:
+        retriever (BaseRetriever): The retriever to wrap.
+        embedding_model (Embeddings): Model used to embed incoming queries.
+        cache (SemanticCache[list[Document]]): Cache holding past queries and their
+            documents.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    retriever: BaseRetriever
+    embedding_model: Embeddings
+    cache: SemanticCache[list[Document]]
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        if not query.strip():
+            return self.retriever.invoke(
+                query, config={"callbacks": run_manager.get_child()}
+            )
+
+        embedding = self.embedding_model.embed_query(query)
+
+        documents = self.cache.lookup(embedding)
+        if documents is not None:
+            return list(documents)
+
+        documents = self.retriever.invoke(
+            query, config={"callbacks": run_manager.get_child()}
+        )
+        self.cache.insert(embedding, list(documents))
+
+        return documents
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        if not query.strip():
+            return await self.retriever.ainvoke(
+                query, config={"callbacks": run_manager.get_child()}
+            )
+
+        embedding = await self.embedding_model.aembed_query(query)
+
+        documents = self.cache.lookup(embedding)
+        if documents is not None:
+            return list(documents)
+
+        documents = await self.retriever.ainvoke(
+            query, config={"callbacks": run_manager.get_child()}
+        )
+        self.cache.insert(embedding, list(documents))
+
+        return documents
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,6 +28,14 @@ class Settings(BaseSettings):
     MONGO_STATE_CHECKPOINT_COLLECTION: str = "celeb_state_checkpoints"
     MONGO_STATE_WRITES_COLLECTION: str = "celeb_state_writes"
     MONGO_LONG_TERM_MEMORY_COLLECTION: str = "celeb_long_term_memory"
+    MONGO_BINARY_VECTORS: bool = Field(
+        default=True,
+        description="Store long-term memory embeddings as packed float32 BSON vectors.",
+    )
+    MONGO_VECTOR_QUANTIZATION: Literal["none", "scalar", "binary"] = Field(
+        default="scalar",
+        description="Quantization of the vectors held in the Atlas vector search index.",
+    )
 
     # --- Comet ML & Opik Configuration ---
     COMET_API_KEY: str | None = Field(
@@ -40,13 +49,29 @@ class Settings(BaseSettings):
     # --- Agents Configuration ---
     TOTAL_MESSAGES_SUMMARY_TRIGGER: int = 30
     TOTAL_MESSAGES_AFTER_SUMMARY: int = 5
+    RESPONSE_CACHE_SIZE: int = 1024
+    RESPONSE_CACHE_THRESHOLD: float = 0.9
 
     # --- RAG Configuration ---
     RAG_TEXT_EMBEDDING_MODEL_ID: str = "sentence-transformers/all-MiniLM-L6-v2"
     RAG_TEXT_EMBEDDING_MODEL_DIM: int = 384
     RAG_TOP_K: int = 5
     RAG_DEVICE: str = "cpu"
+    RAG_EMBED_BACKEND: Literal["hf", "onnx_int8"] = Field(
+        default="hf",
+        description="Embedding inference backend. 'onnx_int8' requires the 'onnx' extra.",
+    )
     RAG_CHUNK_SIZE: int = 256
+    RAG_EMBED_BATCH_SIZE: int = 64
+    RAG_EMBED_CACHE_SIZE: int = 1024
+    RAG_EMBED_MICROBATCH_SIZE: int = 32
+    RAG_EMBED_MICROBATCH_WAIT_MS: float = 10.0
+    RAG_SEMANTIC_CACHE_SIZE: int = 2048
+    RAG_SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    RAG_EXACT_SEARCH_MAX_DOCUMENTS: int = Field(
+        default=10_000,
+        description="Use exact instead of approximate vector search for celebs with at most this many chunks.",
+    )
 
     # --- Paths Configuration ---
     EVALUATION_DATASET_FILE_PATH: Path = Path("data/evaluation_dataset.json")
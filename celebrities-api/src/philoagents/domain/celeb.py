@@ -1,8 +1,8 @@
-import json
 from pathlib import Path
 from typing import List
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CelebExtract(BaseModel):
@@ -23,8 +23,7 @@ class CelebExtract(BaseModel):
 
     @classmethod
     def from_json(cls, metadata_file: Path) -> list["CelebExtract"]:
-        with open(metadata_file, "r") as f:
-            celebs_data = json.load(f)
+        celebs_data = orjson.loads(metadata_file.read_bytes())
 
         return [cls(**celeb) for celeb in celebs_data]
 
@@ -40,6 +39,8 @@ class Celeb(BaseModel):
         style (str): Description of the celeb's talking style.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier for the celeb")
     name: str = Field(description="Name of the celeb")
     perspective: str = Field(
@@ -1,7 +1,6 @@
 from philoagents.domain.exceptions import (
     CelebNameNotFound,
     CelebPerspectiveNotFound,
-    CelebStyleNotFound,
 )
 from philoagents.domain.celeb import Celeb
 
@@ -38,37 +37,48 @@ CELEB_PERSPECTIVES = {
 AVAILABLE_CELEBS = list(CELEB_STYLES.keys())
 
 
+def _build_celebs() -> dict[str, Celeb]:
+    celebs = {}
+    for celeb_id in AVAILABLE_CELEBS:
+        if celeb_id not in CELEB_NAMES:
+            raise CelebNameNotFound(celeb_id)
+
+        if celeb_id not in CELEB_PERSPECTIVES:
+            raise CelebPerspectiveNotFound(celeb_id)
+
+        celebs[celeb_id] = Celeb(
+            id=celeb_id,
+            name=CELEB_NAMES[celeb_id],
+            perspective=CELEB_PERSPECTIVES[celeb_id],
+            style=CELEB_STYLES[celeb_id],
+        )
+
+    return celebs
+
+
+# Celebs are immutable, so they are built once and shared across requests.
+_CELEBS = _build_celebs()
+
+
 class CelebFactory:
     @staticmethod
     def get_celeb(id: str) -> Celeb:
-        """Creates a celeb instance based on the provided ID.
+        """Returns the celeb instance matching the provided ID.
 
         Args:
-            id (str): Identifier of the celeb to create
+            id (str): Identifier of the celeb to return
 
         Returns:
-            Celeb: Instance of the celeb
+            Celeb: Shared, immutable instance of the celeb
 
         Raises:
-            ValueError: If celeb ID is not found in configurations
+            CelebNameNotFound: If celeb ID is not found in configurations
         """
-        id_lower = id.lower()
-
-        if id_lower not in CELEB_NAMES:
-            raise CelebNameNotFound(id_lower)
+        celeb = _CELEBS.get(id.lower())
+        if celeb is None:
+            raise CelebNameNotFound(id.lower())
 
-        if id_lower not in CELEB_PERSPECTIVES:
-            raise CelebPerspectiveNotFound(id_lower)
-
-        if id_lower not in CELEB_STYLES:
-            raise CelebStyleNotFound(id_lower)
-
-        return Celeb(
-            id=id_lower,
-            name=CELEB_NAMES[id_lower],
-            perspective=CELEB_PERSPECTIVES[id_lower],
-            style=CELEB_STYLES[id_lower],
-        )
+        return celeb
 
     @staticmethod
     def get_available_celebs() -> list[str]:
@@ -1,9 +1,10 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from opik.integrations.langchain import OpikTracer
 from pydantic import BaseModel
+from pymongo import AsyncMongoClient
 
 from philoagents.application.conversation_service.generate_response import (
     get_response,
@@ -12,21 +13,25 @@ from philoagents.application.conversation_service.generate_response import (
 from philoagents.application.conversation_service.reset_conversation import (
     reset_conversation_state,
 )
+from philoagents.config import settings
 from philoagents.domain.celeb_factory import CelebFactory
 
 from .opik_utils import configure
 
 configure()
 
+_tracer = OpikTracer()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handles startup and shutdown events for the API."""
-    # Startup code (if any) goes here
+    # Startup code goes here
+    app.state.mongo_client = AsyncMongoClient(settings.MONGO_URI, appname="philoagents")
     yield
     # Shutdown code goes here
-    opik_tracer = OpikTracer()
-    opik_tracer.flush()
+    await app.state.mongo_client.close()
+    _tracer.flush()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -53,7 +58,7 @@ async def chat(chat_message: ChatMessage):
 
         response, _ = await get_response(
             messages=chat_message.message,
-            celeb_id=chat_message.celeb_id,
+            celeb_id=celeb.id,
             celeb_name=celeb.name,
             celeb_perspective=celeb.perspective,
             celeb_style=celeb.style,
@@ -61,8 +66,7 @@ async def chat(chat_message: ChatMessage):
         )
         return {"response": response}
     except Exception as e:
-        opik_tracer = OpikTracer()
-        opik_tracer.flush()
+        _tracer.flush()
 
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -92,7 +96,7 @@ async def websocket_chat(websocket: WebSocket):
                 # Use streaming response instead of get_response
                 response_stream = get_streaming_response(
                     messages=data["message"],
-                    celeb_id=data["celeb_id"],
+                    celeb_id=celeb.id,
                     celeb_name=celeb.name,
                     celeb_perspective=celeb.perspective,
                     celeb_style=celeb.style,
@@ -100,21 +104,19 @@ async def websocket_chat(websocket: WebSocket):
                 )
 
                 # Send initial message to indicate streaming has started
-                await websocket.send_json({"streaming": True})
+                await websocket.send_json({"type": "start"})
 
-                # Stream each chunk of the response
-                full_response = ""
+                # Stream each chunk as a raw binary frame, so tokens skip JSON
+                # encoding and can't be mistaken for the JSON control frames.
+                chunks = []
                 async for chunk in response_stream:
-                    full_response += chunk
-                    await websocket.send_json({"chunk": chunk})
+                    chunks.append(chunk)
+                    await websocket.send_bytes(chunk.encode("utf-8"))
 
-                await websocket.send_json(
-                    {"response": full_response, "streaming": False}
-                )
+                await websocket.send_json({"type": "end", "full": "".join(chunks)})
 
             except Exception as e:
-                opik_tracer = OpikTracer()
-                opik_tracer.flush()
+                _tracer.flush()
 
                 await websocket.send_json({"error": str(e)})
 
@@ -123,7 +125,7 @@ async def websocket_chat(websocket: WebSocket):
 
 
 @app.post("/reset-memory")
-async def reset_conversation():
+async def reset_conversation(request: Request):
     """Resets the conversation state. It deletes the two collections needed for keeping LangGraph state in MongoDB.
 
     Raises:
@@ -132,7 +134,7 @@ async def reset_conversation():
         dict: A dictionary containing the result of the reset operation.
     """
     try:
-        result = await reset_conversation_state()
+        result = await reset_conversation_state(request.app.state.mongo_client)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
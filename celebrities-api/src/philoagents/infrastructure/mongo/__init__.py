@@ -1,4 +1,4 @@
-from .client import MongoClientWrapper
+from .client import MongoClientWrapper, acquire_client, release_client
 from .indexes import MongoIndex
 
-__all__ = ["MongoClientWrapper", "MongoIndex"]
+__all__ = ["MongoClientWrapper", "MongoIndex", "acquire_client", "release_client"]
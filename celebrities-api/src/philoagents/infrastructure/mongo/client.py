@@ -1,14 +1,62 @@
+import threading
+from collections import Counter
 from typing import Generic, Type, TypeVar
 
 from bson import ObjectId
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, SerializeAsAny, TypeAdapter, ValidationError
 from pymongo import MongoClient, errors
 
 from philoagents.config import settings
 
 T = TypeVar("T", bound=BaseModel)
 
+# Wrappers connecting to the same URI share one client, and with it one connection
+# pool. A client is closed once the last wrapper using it is closed.
+_clients: dict[str, MongoClient] = {}
+_client_references: Counter[str] = Counter()
+_clients_lock = threading.Lock()
+
+
+def acquire_client(mongodb_uri: str) -> MongoClient:
+    """Returns the MongoDB client shared by everything connecting to the given URI.
+
+    Every call must be paired with a call to `release_client`, unless the client is
+    used for the rest of the process lifetime.
+
+    Args:
+        mongodb_uri (str): URI for connecting to MongoDB instance.
+
+    Returns:
+        MongoClient: The shared MongoDB client.
+    """
+
+    with _clients_lock:
+        if mongodb_uri not in _clients:
+            _clients[mongodb_uri] = MongoClient(mongodb_uri, appname="philoagents")
+        _client_references[mongodb_uri] += 1
+
+        return _clients[mongodb_uri]
+
+
+def release_client(mongodb_uri: str) -> None:
+    """Releases a client returned by `acquire_client`, closing it if it was the last
+    reference to it.
+
+    Args:
+        mongodb_uri (str): URI the client was acquired for.
+    """
+
+    with _clients_lock:
+        _client_references[mongodb_uri] -= 1
+        if _client_references[mongodb_uri] > 0:
+            return
+
+        del _client_references[mongodb_uri]
+        client = _clients.pop(mongodb_uri)
+
+    client.close()
+
 
 class MongoClientWrapper(Generic[T]):
     """Service class for MongoDB operations, supporting ingestion, querying, and validation.
@@ -27,7 +75,8 @@ class MongoClientWrapper(Generic[T]):
         collection_name (str): Name of the MongoDB collection.
         database_name (str): Name of the MongoDB database.
         mongodb_uri (str): MongoDB connection URI.
-        client (MongoClient): MongoDB client instance for database connections.
+        client (MongoClient): MongoDB client instance for database connections, shared
+            by all the wrappers connected to the same URI.
         database (Database): Reference to the target MongoDB database.
         collection (Collection): Reference to the target MongoDB collection.
     """
@@ -54,16 +103,21 @@ class MongoClientWrapper(Generic[T]):
         """
 
         self.model = model
+        # SerializeAsAny dumps instances of subclasses of the model with all their
+        # fields, as model_dump() would, instead of only the fields of the model.
+        self.__documents_adapter = TypeAdapter(list[SerializeAsAny[model]])
         self.collection_name = collection_name
         self.database_name = database_name
         self.mongodb_uri = mongodb_uri
 
+        self.client = acquire_client(mongodb_uri)
         try:
-            self.client = MongoClient(mongodb_uri, appname="philoagents")
             self.client.admin.command("ping")
         except Exception as e:
+            release_client(mongodb_uri)
             logger.error(f"Failed to initialize MongoDBService: {e}")
             raise
+        self.__closed = False
 
         self.database = self.client[database_name]
         self.collection = self.database[collection_name]
@@ -110,11 +164,16 @@ class MongoClientWrapper(Generic[T]):
             logger.error(f"Error clearing the collection: {e}")
             raise
 
-    def ingest_documents(self, documents: list[T]) -> None:
+    def ingest_documents(self, documents: list[T], batch_size: int = 1000) -> None:
         """Insert multiple documents into the MongoDB collection.
 
+        Documents are serialized and inserted one batch at a time, so only a single
+        batch of raw dictionaries is held in memory at once.
+
         Args:
             documents: List of Pydantic model instances to insert.
+            batch_size (int, optional): Number of documents serialized and sent per
+                insert. Defaults to 1000.
 
         Raises:
             ValueError: If documents is empty or contains non-Pydantic model items.
@@ -127,13 +186,18 @@ class MongoClientWrapper(Generic[T]):
             ):
                 raise ValueError("Documents must be a list of Pycantic models.")
 
-            dict_documents = [doc.model_dump() for doc in documents]
+            for start in range(0, len(documents), batch_size):
+                # A single dump of the whole batch runs in pydantic-core instead of
+                # calling model_dump() once per document.
+                dict_documents = self.__documents_adapter.dump_python(
+                    documents[start : start + batch_size]
+                )
 
-            # Remove '_id' fields to avoid duplicate key errors
-            for doc in dict_documents:
-                doc.pop("_id", None)
+                # Remove '_id' fields to avoid duplicate key errors
+                for doc in dict_documents:
+                    doc.pop("_id", None)
 
-            self.collection.insert_many(dict_documents)
+                self.collection.insert_many(dict_documents)
             logger.debug(f"Inserted {len(documents)} documents into MongoDB.")
         except errors.PyMongoError as e:
             logger.error(f"Error inserting documents: {e}")
@@ -170,25 +234,46 @@ class MongoClientWrapper(Generic[T]):
             documents (list[dict]): List of MongoDB documents to parse.
 
         Returns:
-            list[T]: List of validated Pydantic model instances.
+            list[T]: List of validated Pydantic model instances. Documents failing
+                validation are logged and skipped.
         """
-        parsed_documents = []
-        for doc in documents:
-            for key, value in doc.items():
-                if isinstance(value, ObjectId):
-                    doc[key] = str(value)
-
-            _id = doc.pop("_id", None)
-            doc["id"] = _id
+        payload = [
+            {
+                "id" if key == "_id" else key: (
+                    str(value) if isinstance(value, ObjectId) else value
+                )
+                for key, value in doc.items()
+            }
+            for doc in documents
+        ]
+
+        # Validate the whole batch in a single pydantic-core call, and only fall back
+        # to per-document validation when some document is invalid.
+        try:
+            return self.__documents_adapter.validate_python(payload)
+        except ValidationError:
+            pass
 
-            parsed_doc = self.model.model_validate(doc)
-            parsed_documents.append(parsed_doc)
+        parsed_documents = []
+        for doc in payload:
+            try:
+                parsed_documents.append(self.model.model_validate(doc))
+            except ValidationError as e:
+                logger.warning(f"Skipping invalid document {doc.get('id')}: {e}")
 
         return parsed_documents
 
-    def get_collection_count(self) -> int:
+    def get_collection_count(self, exact: bool = False) -> int:
         """Count the total number of documents in the collection.
 
+        By default, the count is read from the collection metadata in constant time.
+        It may drift after an unclean shutdown or while orphaned documents exist on
+        a sharded cluster.
+
+        Args:
+            exact (bool, optional): Whether to scan the collection for an exact
+                count instead. Defaults to False.
+
         Returns:
             Total number of documents in the collection.
 
@@ -197,7 +282,10 @@ class MongoClientWrapper(Generic[T]):
         """
 
         try:
-            return self.collection.count_documents({})
+            if exact:
+                return self.collection.count_documents({})
+
+            return self.collection.estimated_document_count()
         except errors.PyMongoError as e:
             logger.error(f"Error counting documents in MongoDB: {e}")
             raise
@@ -206,8 +294,13 @@ class MongoClientWrapper(Generic[T]):
         """Close the MongoDB connection.
 
         This method should be called when the service is no longer needed
-        to properly release resources, unless using the context manager.
+        to properly release resources, unless using the context manager. The
+        shared client is only closed once no other wrapper is using it.
         """
 
-        self.client.close()
+        # Guards against releasing the shared client twice when closing twice.
+        if not self.__closed:
+            self.__closed = True
+            release_client(self.mongodb_uri)
+
         logger.debug("Closed MongoDB connection.")
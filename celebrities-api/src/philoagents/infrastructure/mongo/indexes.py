@@ -1,4 +1,9 @@
-from langchain_mongodb.index import create_fulltext_search_index
+import time
+from contextlib import contextmanager
+from typing import Any, Generator, Literal
+
+from loguru import logger
+from pymongo.operations import SearchIndexModel
 
 from .client import MongoClientWrapper
 
@@ -16,15 +21,184 @@ class MongoIndex:
         self,
         embedding_dim: int,
         is_hybrid: bool = False,
+        quantization: Literal["none", "scalar", "binary"] = "none",
     ) -> None:
-        vectorstore = self.retriever.vectorstore
+        # The search indexes may survive between runs. Only create the ones that are
+        # missing, and update the ones whose definition changed, e.g. to add the
+        # celeb_id filter fields to indexes created by an older version.
+        existing_definitions = self.__get_index_definitions()
 
-        vectorstore.create_vector_search_index(
-            dimensions=embedding_dim,
+        self.__ensure_search_index(
+            name=self.retriever.vectorstore._index_name,
+            type="vectorSearch",
+            definition=self.__vector_search_index_definition(
+                embedding_dim, quantization
+            ),
+            existing_definitions=existing_definitions,
         )
         if is_hybrid:
-            create_fulltext_search_index(
-                collection=self.mongodb_client.collection,
-                field=vectorstore._text_key,
-                index_name=self.retriever.search_index_name,
+            self.__ensure_search_index(
+                name=self.retriever.search_index_name,
+                type="search",
+                definition=self.__fulltext_search_index_definition(),
+                existing_definitions=existing_definitions,
             )
+
+        # Metadata-only lookups, such as MongoClientWrapper.fetch_documents filtering
+        # by celeb, are served by a regular index instead of a collection scan. This
+        # is a no-op if the index already exists.
+        self.mongodb_client.collection.create_index("celeb_id")
+
+    def drop(self, timeout: float = 300.0) -> None:
+        """Drops the search indexes and waits until Atlas has removed them.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait for the indexes to be
+                removed.
+
+        Raises:
+            TimeoutError: If the indexes still exist after the timeout.
+        """
+
+        index_names = self.__get_index_names() & {
+            self.retriever.vectorstore._index_name,
+            self.retriever.search_index_name,
+        }
+        for index_name in index_names:
+            self.mongodb_client.collection.drop_search_index(index_name)
+
+        # Search indexes are dropped asynchronously, and an index that is still being
+        # deleted would be mistaken for an existing one when recreating it.
+        deadline = time.monotonic() + timeout
+        while self.__get_index_names() & index_names:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Search indexes {index_names} were not dropped.")
+
+            time.sleep(1)
+
+    @contextmanager
+    def bulk_load(
+        self,
+        embedding_dim: int,
+        is_hybrid: bool = False,
+        quantization: Literal["none", "scalar", "binary"] = "none",
+        drop_indexes: bool = False,
+    ) -> Generator[None, None, None]:
+        """Makes sure the search indexes exist once a bulk load is done.
+
+        The indexes are created even if the load fails, so retrieval keeps working.
+        Optionally, they are dropped for the duration of the load, since building
+        them once over the final data is much cheaper than keeping them up to date
+        on every insert. Searches fail until they are rebuilt, so only drop them
+        when nothing is serving queries from the collection.
+
+        Args:
+            embedding_dim (int): Dimension of the stored embeddings.
+            is_hybrid (bool): Whether to also create the full-text search index.
+            quantization (Literal["none", "scalar", "binary"]): Quantization of the
+                vectors held in the vector search index.
+            drop_indexes (bool): Whether to drop the search indexes during the load.
+                Defaults to False.
+        """
+
+        try:
+            if drop_indexes:
+                self.drop()
+            yield
+        finally:
+            self.create(
+                embedding_dim=embedding_dim,
+                is_hybrid=is_hybrid,
+                quantization=quantization,
+            )
+
+    def __get_index_names(self) -> set[str]:
+        return set(self.__get_index_definitions())
+
+    def __get_index_definitions(self) -> dict[str, dict[str, Any]]:
+        return {
+            index["name"]: index.get("latestDefinition", {})
+            for index in self.mongodb_client.collection.list_search_indexes()
+        }
+
+    def __ensure_search_index(
+        self,
+        name: str,
+        type: Literal["search", "vectorSearch"],
+        definition: dict[str, Any],
+        existing_definitions: dict[str, dict[str, Any]],
+    ) -> None:
+        collection = self.mongodb_client.collection
+
+        if name not in existing_definitions:
+            if collection.name not in collection.database.list_collection_names():
+                collection.database.create_collection(collection.name)
+
+            collection.create_search_index(
+                SearchIndexModel(definition=definition, name=name, type=type)
+            )
+        elif not _is_subset(definition, existing_definitions[name]):
+            # Atlas keeps serving queries from the old definition until the new one
+            # is built.
+            logger.info(f"Updating the definition of the search index {name}.")
+            collection.update_search_index(name, definition)
+
+    def __fulltext_search_index_definition(self) -> dict[str, Any]:
+        # celeb_id is indexed as a token so the hybrid retriever can filter inside
+        # $search with an equals clause.
+        return {
+            "mappings": {
+                "dynamic": False,
+                "fields": {
+                    self.retriever.vectorstore._text_key: [{"type": "string"}],
+                    "celeb_id": [{"type": "token"}],
+                },
+            }
+        }
+
+    def __vector_search_index_definition(
+        self, embedding_dim: int, quantization: Literal["none", "scalar", "binary"]
+    ) -> dict[str, Any]:
+        # langchain-mongodb can't set per-field options such as quantization, so the
+        # index definition is built here instead.
+        vectorstore = self.retriever.vectorstore
+
+        vector_field = {
+            "type": "vector",
+            "path": vectorstore._embedding_key,
+            "numDimensions": embedding_dim,
+            "similarity": vectorstore._relevance_score_fn,
+        }
+        # Left out when disabled, as Atlas omits the default from stored definitions.
+        if quantization != "none":
+            vector_field["quantization"] = quantization
+
+        return {
+            "fields": [
+                vector_field,
+                # Lets retrievers pre-filter the search to a single celeb.
+                {"type": "filter", "path": "celeb_id"},
+            ]
+        }
+
+
+def _is_subset(expected: Any, actual: Any) -> bool:
+    """Checks whether an index definition matches a definition stored by Atlas.
+
+    Atlas may add default options to the definitions it stores, so only the options
+    set in the expected definition are compared.
+    """
+
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _is_subset(value, actual[key])
+            for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        return (
+            isinstance(actual, list)
+            and len(expected) == len(actual)
+            and all(_is_subset(e, a) for e, a in zip(expected, actual))
+        )
+
+    return expected == actual
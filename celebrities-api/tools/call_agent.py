@@ -41,8 +41,7 @@ async def main(celeb_id: str, query: str) -> None:
         query: Query to call the agent with.
     """
 
-    celeb_factory = CelebFactory()
-    celeb = celeb_factory.get_celeb(celeb_id)
+    celeb = CelebFactory.get_celeb(celeb_id)
 
     print(
         f"\033[32mCalling agent with celeb_id: `{celeb_id}` and query: `{query}`\033[0m"
@@ -51,7 +50,7 @@ async def main(celeb_id: str, query: str) -> None:
     print("\033[32m--------------------------------\033[0m")
     async for chunk in get_streaming_response(
         messages=query,
-        celeb_id=celeb_id,
+        celeb_id=celeb.id,
         celeb_name=celeb.name,
         celeb_perspective=celeb.perspective,
         celeb_style=celeb.style,
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import click
@@ -14,16 +15,23 @@ from philoagents.domain.celeb import CelebExtract
     default=settings.EXTRACTION_METADATA_FILE_PATH,
     help="Path to the celebs extraction metadata JSON file.",
 )
-def main(metadata_file: Path) -> None:
+@click.option(
+    "--drop-indexes",
+    is_flag=True,
+    default=False,
+    help="Drop the search indexes while ingesting, and rebuild them afterwards. Faster, but searches fail until the rebuild is done.",
+)
+def main(metadata_file: Path, drop_indexes: bool) -> None:
     """CLI command to create long-term memory for celebs.
 
     Args:
         metadata_file: Path to the celebs extraction metadata JSON file.
+        drop_indexes: Whether to drop the search indexes while ingesting.
     """
     celebs = CelebExtract.from_json(metadata_file)
 
     long_term_memory_creator = LongTermMemoryCreator.build_from_settings()
-    long_term_memory_creator(celebs)
+    asyncio.run(long_term_memory_creator(celebs, drop_indexes=drop_indexes))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import click
@@ -46,7 +47,7 @@ def main(metadata_file: Path, temperature: float, max_samples: int) -> None:
     evaluation_dataset_generator = EvaluationDatasetGenerator(
         temperature=temperature, max_samples=max_samples
     )
-    evaluation_dataset_generator(celebs)
+    asyncio.run(evaluation_dataset_generator(celebs))
 
 
 if __name__ == "__main__":
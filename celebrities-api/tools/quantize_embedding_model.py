@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import click
+from loguru import logger
+from sentence_transformers import (
+    SentenceTransformer,
+    export_dynamic_quantized_onnx_model,
+)
+
+from philoagents.application.rag.embeddings import ONNX_INT8_MODEL_FILE_NAME
+from philoagents.config import settings
+
+
+@click.command()
+@click.option(
+    "--model-id",
+    type=str,
+    default=settings.RAG_TEXT_EMBEDDING_MODEL_ID,
+    help="ID of the HuggingFace embedding model to quantize.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(path_type=Path),
+    default=Path("models/embedding_model_onnx"),
+    help="Directory where the ONNX model is saved.",
+)
+def main(model_id: str, output_dir: Path) -> None:
+    """CLI command to export an embedding model to ONNX with int8 dynamic quantization.
+
+    Point RAG_TEXT_EMBEDDING_MODEL_ID to the output directory and set
+    RAG_EMBED_BACKEND=onnx_int8 to use it.
+
+    Args:
+        model_id: ID of the HuggingFace embedding model to quantize.
+        output_dir: Directory where the ONNX model is saved.
+    """
+
+    model = SentenceTransformer(model_id, backend="onnx")
+    model.save_pretrained(str(output_dir))
+
+    export_dynamic_quantized_onnx_model(
+        model,
+        quantization_config="avx512_vnni",
+        model_name_or_path=str(output_dir),
+    )
+
+    logger.info(f"Saved quantized model to '{output_dir / ONNX_INT8_MODEL_FILE_NAME}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ class WebSocketApiService {
     this.connected = false;
     this.connectionPromise = null;
     this.connectionTimeout = 10000;
+    this.textDecoder = new TextDecoder();
   }
 
   determineWebSocketBaseUrl() {
@@ -42,6 +43,7 @@ class WebSocketApiService {
       }, this.connectionTimeout);
 
       this.socket = new WebSocket(`${this.baseUrl}/ws/chat`);
+      this.socket.binaryType = 'arraybuffer';
       
       this.socket.onopen = () => {
         console.log('WebSocket connection established');
@@ -70,6 +72,13 @@ class WebSocketApiService {
   }
 
   handleMessage(event) {
+    // Streamed tokens arrive as raw UTF-8 binary frames
+    if (event.data instanceof ArrayBuffer) {
+      this.triggerCallback('chunk', this.textDecoder.decode(event.data));
+      return;
+    }
+
+    // Control messages arrive as JSON text frames
     const data = JSON.parse(event.data);
     
     if (data.error) {
@@ -77,18 +86,13 @@ class WebSocketApiService {
       return;
     }
     
-    if (data.streaming !== undefined) {
-      this.handleStreamingUpdate(data.streaming);
-      return;
-    }
-    
-    if (data.chunk) {
-      this.triggerCallback('chunk', data.chunk);
+    if (data.type === 'start') {
+      this.handleStreamingUpdate(true);
       return;
     }
     
-    if (data.response) {
-      this.triggerCallback('message', data.response);
+    if (data.type === 'end') {
+      this.handleStreamingUpdate(false);
     }
   }
 